@@ -30,7 +30,7 @@ def AStar(
     a_star = A_Star(Maze, start_cell)
     path = a_star.pathFinding()
 
-    Maze.tracePath({Agent: path})
+    Maze.tracePath({Agent: path.AsDict()})
     textLabel(Maze, title="A* Algorithm: ", value=len(path) + 1)
 
     Maze.run()
@@ -41,7 +41,7 @@ def BFS(
     search_path, path = bfs.pathFinding()
 
     Maze.tracePath({SearchAgent: search_path})
-    Maze.tracePath({Agent: path})
+    Maze.tracePath({Agent: path.AsDict()})
     textLabel(Maze, title="BFS Algorithm: ", value=len(search_path) + 1)
 
     Maze.run()
@@ -41,7 +41,7 @@ def DFS(
     search_path, path = dfs.pathFinding()
 
     Maze.tracePath({SearchAgent: search_path})
-    Maze.tracePath({Agent: path})
+    Maze.tracePath({Agent: path.AsDict()})
     textLabel(Maze, title="DFS Algorithm: ", value=len(search_path) + 1)
 
     Maze.run()
@@ -0,0 +1,62 @@
+from pyamaze import maze, agent, COLOR, textLabel
+from MazeRace import RunRace, FormatReport
+
+RACE_COLORS = {
+    "A*": COLOR.red,
+    "BFS": COLOR.blue,
+    "DFS": COLOR.yellow,
+    "Wallfollowing": COLOR.cyan,
+}
+
+
+def Race(
+    rows: int = 10,
+    cols: int = 10,
+    start_cell: tuple[int, int] = (1, 1),
+    theme: str = "dark",
+    loopPercent: int = 0,
+    shape: str = "square",
+    filled: bool = False,
+    footprints: bool = True,
+):
+    x, y = start_cell
+    Maze = maze(rows, cols)
+    Maze.CreateMaze(x=Maze.rows, y=Maze.cols, loopPercent=loopPercent, theme=theme)
+
+    results, total_ms = RunRace(Maze, start_cell)
+    print(FormatReport(results, total_ms))
+
+    paths = {}
+    for result in results:
+        if "error" in result:
+            # Unreachable goal, wall-following loop or timeout, as in the report
+            textLabel(Maze, title=f"{result['algorithm']}: ", value=result["error"])
+            continue
+        Agent = agent(
+            parentMaze=Maze,
+            x=x,
+            y=y,
+            shape=shape,
+            filled=filled,
+            footprints=footprints,
+            color=RACE_COLORS[result["algorithm"]],
+        )
+        paths[Agent] = result["path"].AsString()
+        textLabel(
+            Maze,
+            title=f"{result['algorithm']}: ",
+            value=f"{result['steps'] + 1} cells, {result['explored']} explored, "
+            f"{result['solve_ms']:.1f} ms",
+        )
+
+    # All agents move together so the paths overlay each other
+    Maze.tracePath(paths)
+    Maze.run()
+
+
+def main() -> None:
+    Race()
+
+
+if __name__ == "__main__":
+    main()
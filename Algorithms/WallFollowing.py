@@ -36,8 +36,8 @@ def Wallfollowing(
     Wallfollowing = WallFollowing(Maze, start_cell)
     no_deadends_path, deadends_path = Wallfollowing.pathFinding()
 
-    Maze.tracePath({Deadends_Agent: deadends_path})
-    Maze.tracePath({Agent: no_deadends_path})
+    Maze.tracePath({Deadends_Agent: deadends_path.AsString()})
+    Maze.tracePath({Agent: no_deadends_path.AsString()})
     textLabel(
         Maze,
         title="Wall Following Algorithm: ",
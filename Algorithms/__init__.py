@@ -1,4 +1,5 @@
 from Algorithms.AStar import AStar
 from Algorithms.BFS import BFS
 from Algorithms.DFS import DFS
-from Algorithms.WallFollowing import Wallfollowing
\ No newline at end of file
+from Algorithms.WallFollowing import Wallfollowing
+from Algorithms.Race import Race
\ No newline at end of file
@@ -89,6 +89,7 @@ class MazeControlApp(tk.Tk):
             "DFS": ("Algorithms.DFS", "DFS"),
             "BFS": ("Algorithms.BFS", "BFS"),
             "Wallfollowing": ("Algorithms.WallFollowing", "Wallfollowing"),
+            "Race (all)": ("Algorithms.Race", "Race"),
         }
 
         # ---------- Build UI ----------
@@ -140,6 +141,8 @@ class MazeControlApp(tk.Tk):
         self.color_combo.config(values=allowed_colors)
         if self.color.get() not in allowed_colors:
             self.color.set("cyan")
+        # Race mode gives every algorithm its own color
+        self.color_combo.config(state="disabled" if algo == "Race (all)" else "readonly")
 
     def _update_start_limits(self):
         """Ensure start_x and start_y are within rows/cols"""
@@ -301,6 +304,10 @@ class MazeControlApp(tk.Tk):
             params.pop("shape", None)
             params.pop("filled", None)
 
+        # Race mode picks one color per algorithm
+        if algo == "Race (all)":
+            params.pop("color", None)
+
         # Run in separate process
         p = Process(target=_child_runner, args=(module_name, func_name, params))
         p.start()
@@ -0,0 +1,225 @@
+class UnreachableGoalError(ValueError):
+    """Raised when the goal cell is not connected to the start cell"""
+
+
+OFFSETS = {"N": (-1, 0), "S": (1, 0), "E": (0, 1), "W": (0, -1)}
+OPPOSITE = {"N": "S", "S": "N", "E": "W", "W": "E"}
+
+
+def IsOpen(maze_map: dict, cell, direction: str) -> bool:
+    """
+    True when the passage from cell in direction can be walked: both cells
+    it joins must have that wall open. The index and every solver use this
+    one test, so they always agree on a hand-edited map.
+    """
+    if not maze_map[cell].get(direction):
+        return False
+    dx, dy = OFFSETS[direction]
+    neighbour = maze_map.get((cell[0] + dx, cell[1] + dy))
+    return neighbour is not None and bool(neighbour.get(OPPOSITE[direction]))
+
+
+class DisjointSet:
+    """Union-find over the integers 0..size-1 (union by size, path halving)"""
+
+    def __init__(self, size: int) -> None:
+        self.parent = list(range(size))
+        self.size = [1] * size
+
+    def Find(self, item: int) -> int:
+        parent = self.parent
+        while parent[item] != item:
+            parent[item] = parent[parent[item]]
+            item = parent[item]
+        return item
+
+    def Union(self, a: int, b: int) -> bool:
+        root_a, root_b = self.Find(a), self.Find(b)
+        if root_a == root_b:
+            return False
+        if self.size[root_a] < self.size[root_b]:
+            root_a, root_b = root_b, root_a
+        self.parent[root_b] = root_a
+        self.size[root_a] += self.size[root_b]
+        return True
+
+
+class ConnectivityIndex:
+    """
+    Connectivity of the open passages of a maze. It reflects maze.maze_map as
+    it was when built: build one per maze and pass it to every solver that
+    shares that maze, and build a new one after editing the map.
+
+    Passages are open by the same IsOpen test the solvers use, so a cell the
+    index calls reachable is one the solvers can actually get to, even on a
+    hand-edited map with one-sided walls. Component queries are O(1) after
+    construction; bridges and articulation points are computed on first use.
+    """
+
+    def __init__(self, maze) -> None:
+        self.rows = maze.rows
+        self.cols = maze.cols
+        self.goal_cell = (self.rows, self.cols)
+        maze_map = maze.maze_map
+
+        self.neighbours = [[] for _ in range(self.rows * self.cols)]
+        sets = DisjointSet(self.rows * self.cols)
+        for x, y in maze_map:
+            if not self.Contains((x, y)):
+                continue
+            index = self.Index((x, y))
+            # Only look East and South so every passage is seen once
+            if y < self.cols and IsOpen(maze_map, (x, y), "E"):
+                self._Connect(sets, index, index + 1)
+            if x < self.rows and IsOpen(maze_map, (x, y), "S"):
+                self._Connect(sets, index, index + self.cols)
+
+        # Flatten to component labels so queries never walk the forest
+        self.component = [sets.Find(i) for i in range(self.rows * self.cols)]
+        self.component_size = {
+            root: sets.size[root] for root in set(self.component)
+        }
+        self._bridges = None
+        self._articulation_points = None
+
+    def _Connect(self, sets: DisjointSet, a: int, b: int) -> None:
+        sets.Union(a, b)
+        self.neighbours[a].append(b)
+        self.neighbours[b].append(a)
+
+    def Contains(self, cell) -> bool:
+        x, y = cell
+        return 1 <= x <= self.rows and 1 <= y <= self.cols
+
+    def Index(self, cell) -> int:
+        x, y = cell
+        return (x - 1) * self.cols + (y - 1)
+
+    def Cell(self, index: int) -> tuple[int, int]:
+        return index // self.cols + 1, index % self.cols + 1
+
+    def Component(self, cell) -> int:
+        """Label of the component the cell belongs to"""
+        return self.component[self.Index(cell)]
+
+    def ComponentSize(self, cell) -> int:
+        return self.component_size[self.Component(cell)]
+
+    def ComponentCount(self) -> int:
+        return len(self.component_size)
+
+    def IsReachable(self, cell, target_cell=None) -> bool:
+        """True when target_cell (the goal by default) can be reached from cell"""
+        if target_cell is None:
+            target_cell = self.goal_cell
+        if not (self.Contains(cell) and self.Contains(target_cell)):
+            return False
+        return self.Component(cell) == self.Component(target_cell)
+
+    # ---------- Chokepoints ----------
+    def _FindChokepoints(self) -> None:
+        """Iterative Tarjan lowlink search (mazes are too deep for recursion)"""
+        count = self.rows * self.cols
+        order = [0] * count
+        low = [0] * count
+        bridges = set()
+        articulation_points = set()
+        counter = 1
+
+        for root in range(count):
+            if order[root]:
+                continue
+            order[root] = low[root] = counter
+            counter += 1
+            root_children = 0
+            # Each frame: (cell, parent, position in its neighbour list)
+            stack = [(root, -1, 0)]
+            while stack:
+                cell, parent, position = stack[-1]
+                neighbours = self.neighbours[cell]
+                if position < len(neighbours):
+                    stack[-1] = (cell, parent, position + 1)
+                    child = neighbours[position]
+                    if child == parent:
+                        continue
+                    if order[child]:
+                        low[cell] = min(low[cell], order[child])
+                    else:
+                        order[child] = low[child] = counter
+                        counter += 1
+                        if cell == root:
+                            root_children += 1
+                        stack.append((child, cell, 0))
+                    continue
+
+                stack.pop()
+                if parent < 0:
+                    continue
+                low[parent] = min(low[parent], low[cell])
+                if low[cell] > order[parent]:
+                    bridges.add((min(parent, cell), max(parent, cell)))
+                if parent != root and low[cell] >= order[parent]:
+                    articulation_points.add(parent)
+
+            if root_children > 1:
+                articulation_points.add(root)
+
+        self._bridges = bridges
+        self._articulation_points = articulation_points
+
+    def Bridges(self) -> set[tuple[tuple[int, int], tuple[int, int]]]:
+        """Passages whose removal disconnects their component"""
+        if self._bridges is None:
+            self._FindChokepoints()
+        return {(self.Cell(a), self.Cell(b)) for a, b in self._bridges}  # type:ignore
+
+    def ArticulationPoints(self) -> set[tuple[int, int]]:
+        """Cells whose removal disconnects their component"""
+        if self._articulation_points is None:
+            self._FindChokepoints()
+        return {self.Cell(i) for i in self._articulation_points}  # type:ignore
+
+    def IsBridge(self, cell_a, cell_b) -> bool:
+        if self._bridges is None:
+            self._FindChokepoints()
+        a, b = self.Index(cell_a), self.Index(cell_b)
+        return (min(a, b), max(a, b)) in self._bridges  # type:ignore
+
+    def IsArticulationPoint(self, cell) -> bool:
+        if self._articulation_points is None:
+            self._FindChokepoints()
+        return self.Index(cell) in self._articulation_points  # type:ignore
+
+    def MandatoryPassages(self, cell, target_cell=None) -> list:
+        """
+        Bridges every route from cell to target_cell (the goal by default)
+        has to cross, in order. Any one route crosses exactly these bridges.
+        """
+        if target_cell is None:
+            target_cell = self.goal_cell
+        if not self.IsReachable(cell, target_cell):
+            return []
+        if self._bridges is None:
+            self._FindChokepoints()
+
+        start, target = self.Index(cell), self.Index(target_cell)
+        came_from = {start: start}
+        frontier = [start]
+        while target not in came_from:
+            next_frontier = []
+            for current in frontier:
+                for child in self.neighbours[current]:
+                    if child not in came_from:
+                        came_from[child] = current
+                        next_frontier.append(child)
+            frontier = next_frontier
+
+        passages = []
+        current = target
+        while current != start:
+            parent = came_from[current]
+            if (min(parent, current), max(parent, current)) in self._bridges:  # type:ignore
+                passages.append((self.Cell(parent), self.Cell(current)))
+            current = parent
+        passages.reverse()
+        return passages
@@ -0,0 +1,213 @@
+import csv
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+from MazeConnectivity import DisjointSet
+
+# One bit per open wall, in pyamaze's maze_map key order
+WALL_BITS = {"E": 1, "W": 2, "N": 4, "S": 8}
+
+
+class TiledMaze:
+    """
+    A generated maze stored as one byte of wall bits per cell (row-major).
+
+    It exposes rows, cols, grid and maze_map like a pyamaze maze, so the
+    MazeSolving solvers accept it directly. maze_map is only built the first
+    time it is read. To display it, Save() it to CSV and pass the file to
+    pyamaze: Maze.CreateMaze(x=rows, y=cols, loadMaze=filename).
+    """
+
+    def __init__(self, rows: int, cols: int, walls: bytearray) -> None:
+        self.rows = rows
+        self.cols = cols
+        self.walls = walls
+        self._maze_map = None
+
+    @classmethod
+    def FromMazeMap(cls, maze_map: dict, rows: int, cols: int) -> "TiledMaze":
+        walls = bytearray(rows * cols)
+        for (x, y), cell_walls in maze_map.items():
+            # pyamaze keeps the cells of its default 10x10 grid when loadMaze
+            # reads a smaller CSV, so skip anything outside rows x cols
+            if not (1 <= x <= rows and 1 <= y <= cols):
+                continue
+            bits = 0
+            for direction, bit in WALL_BITS.items():
+                if cell_walls[direction]:
+                    bits |= bit
+            walls[(x - 1) * cols + (y - 1)] = bits
+        return cls(rows, cols, walls)
+
+    @property
+    def grid(self) -> list[tuple[int, int]]:
+        # Same (column-major) order pyamaze uses
+        return [(x, y) for y in range(1, self.cols + 1) for x in range(1, self.rows + 1)]
+
+    @property
+    def maze_map(self) -> dict:
+        if self._maze_map is None:
+            cols = self.cols
+            walls = self.walls
+            self._maze_map = {
+                (x, y): {
+                    direction: 1 if walls[(x - 1) * cols + (y - 1)] & bit else 0
+                    for direction, bit in WALL_BITS.items()
+                }
+                for x, y in self.grid
+            }
+        return self._maze_map
+
+    def Save(self, filename: str) -> None:
+        """Write the maze in the CSV layout pyamaze's loadMaze reads"""
+        maze_map = self.maze_map
+        with open(filename, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["  cell  ", "E", "W", "N", "S"])
+            for cell in self.grid:
+                walls = maze_map[cell]
+                writer.writerow(
+                    [cell, walls["E"], walls["W"], walls["N"], walls["S"]]
+                )
+
+
+# ---------- Worker: executed inside the pool processes ----------
+def _GenerateTile(job: tuple[int, int, int, int]) -> bytes:
+    """Perfect maze (iterative backtracker) for one tile, in tile-local indices"""
+    rows, cols, seed, loopPercent = job
+    rng = random.Random(seed)
+    walls = bytearray(rows * cols)
+    visited = bytearray(rows * cols)
+    start = rng.randrange(rows * cols)
+    visited[start] = 1
+    stack = [start]
+    while stack:
+        cell = stack[-1]
+        x, y = divmod(cell, cols)
+        options = []
+        if y + 1 < cols and not visited[cell + 1]:
+            options.append((cell + 1, 1, 2))  # E / W
+        if y > 0 and not visited[cell - 1]:
+            options.append((cell - 1, 2, 1))  # W / E
+        if x > 0 and not visited[cell - cols]:
+            options.append((cell - cols, 4, 8))  # N / S
+        if x + 1 < rows and not visited[cell + cols]:
+            options.append((cell + cols, 8, 4))  # S / N
+        if not options:
+            stack.pop()
+            continue
+        child, bit, child_bit = rng.choice(options)
+        walls[cell] |= bit
+        walls[child] |= child_bit
+        visited[child] = 1
+        stack.append(child)
+
+    if loopPercent:
+        closed = []
+        for cell in range(rows * cols):
+            x, y = divmod(cell, cols)
+            if y + 1 < cols and not walls[cell] & 1:
+                closed.append((cell, cell + 1, 1, 2))
+            if x + 1 < rows and not walls[cell] & 8:
+                closed.append((cell, cell + cols, 8, 4))
+        for cell, child, bit, child_bit in rng.sample(
+            closed, round(len(closed) * min(loopPercent, 100) / 100)
+        ):
+            walls[cell] |= bit
+            walls[child] |= child_bit
+    return bytes(walls)
+
+
+def GenerateTiledMaze(
+    rows: int = 10,
+    cols: int = 10,
+    tile_size: int = 64,
+    loopPercent: int = 0,
+    seed: int | None = None,
+    workers: int | None = None,
+) -> TiledMaze:
+    """
+    Generate a rows x cols maze by splitting it into tile_size x tile_size
+    tiles, building each tile in a worker process and joining the tiles
+    along a random spanning tree of the tile grid (one passage per joined
+    border), so with loopPercent=0 the result is still a perfect maze.
+
+    loopPercent opens that percentage of the remaining inner walls (inside
+    tiles and along the tile borders). The same seed always gives the same
+    maze, whatever the number of workers.
+    """
+    if seed is None:
+        seed = random.randrange(2**32)
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    tile_rows = range(0, rows, tile_size)
+    tile_cols = range(0, cols, tile_size)
+    tiles = [(top, left) for top in tile_rows for left in tile_cols]
+    jobs = [
+        (
+            min(tile_size, rows - top),
+            min(tile_size, cols - left),
+            seed * 1_000_003 + index,
+            loopPercent,
+        )
+        for index, (top, left) in enumerate(tiles)
+    ]
+
+    if workers > 1 and len(jobs) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+            results = list(
+                pool.map(_GenerateTile, jobs, chunksize=max(1, len(jobs) // (4 * workers)))
+            )
+    else:
+        results = list(map(_GenerateTile, jobs))
+
+    # Copy every tile into the full grid one row slice at a time
+    walls = bytearray(rows * cols)
+    for (top, left), (height, width, _, _), tile in zip(tiles, jobs, results):
+        for x in range(height):
+            start = (top + x) * cols + left
+            walls[start:start + width] = tile[x * width:(x + 1) * width]
+
+    # Candidate passages between neighbouring tiles, as (cell, child, bits)
+    rng = random.Random(seed)
+    per_row = len(tile_cols)
+    borders = []
+    for index, (top, left) in enumerate(tiles):
+        height, width = jobs[index][0], jobs[index][1]
+        if left + width < cols:
+            y = left + width - 1
+            borders.append((index, index + 1, [
+                ((top + x) * cols + y, (top + x) * cols + y + 1, 1, 2)
+                for x in range(height)
+            ]))
+        if top + height < rows:
+            x = top + height - 1
+            borders.append((index, index + per_row, [
+                (x * cols + left + y, (x + 1) * cols + left + y, 8, 4)
+                for y in range(width)
+            ]))
+
+    rng.shuffle(borders)
+    tile_sets = DisjointSet(len(tiles))
+    for tile_a, tile_b, passages in borders:
+        if tile_sets.Union(tile_a, tile_b):
+            cell, child, bit, child_bit = rng.choice(passages)
+            walls[cell] |= bit
+            walls[child] |= child_bit
+
+    if loopPercent:
+        closed = [
+            passage
+            for _, _, passages in borders
+            for passage in passages
+            if not walls[passage[0]] & passage[2]
+        ]
+        for cell, child, bit, child_bit in rng.sample(
+            closed, round(len(closed) * min(loopPercent, 100) / 100)
+        ):
+            walls[cell] |= bit
+            walls[child] |= child_bit
+
+    return TiledMaze(rows, cols, walls)
@@ -0,0 +1,158 @@
+from MazeConnectivity import UnreachableGoalError
+
+DIRECTIONS = "NSEW"
+# Opposite directions differ only in the lowest bit: N^1 == S, E^1 == W
+CODES = {direction: code for code, direction in enumerate(DIRECTIONS)}
+STEPS = ((-1, 0), (1, 0), (0, 1), (0, -1))
+# Steps between the cells remembered for indexing
+CHECKPOINT_STRIDE = 64
+
+
+class Path:
+    """
+    A walk through the maze stored as its start cell plus one direction code
+    per step (a byte each), instead of a dictionary of cell tuples.
+
+    len() is the number of steps, iterating yields the cells visited
+    (start included) and slicing returns a Path sharing the same buffer.
+    AsDict() and AsString() build the formats pyamaze's tracePath expects.
+
+    Indexing (path[i]) and the start of a slice are found from a cell kept
+    every CHECKPOINT_STRIDE steps, so after one O(n) pass on first use each
+    lookup walks at most CHECKPOINT_STRIDE codes.
+    """
+
+    __slots__ = ("start_cell", "codes", "_checkpoints")
+
+    def __init__(self, start_cell, codes=b"") -> None:
+        self.start_cell = tuple(start_cell)
+        self.codes = memoryview(codes if codes else bytearray()).cast("B")
+        self._checkpoints = None
+
+    def __reduce__(self):
+        # memoryviews cannot be pickled; ship the codes as bytes instead
+        return Path, (self.start_cell, bytes(self.codes))
+
+    @classmethod
+    def FromDirections(cls, start_cell, directions: str) -> "Path":
+        return cls(start_cell, bytearray(CODES[d] for d in directions))
+
+    @classmethod
+    def FromParents(cls, parents: dict, start_cell, goal_cell) -> "Path":
+        """Rebuild the walk from a child -> parent map filled during a search"""
+        codes = bytearray()
+        cell = goal_cell
+        while cell != start_cell:
+            parent = parents.get(cell)
+            if parent is None:
+                raise UnreachableGoalError(
+                    f"Goal {goal_cell} cannot be reached from {start_cell}"
+                )
+            codes.append(CODES[Direction(parent, cell)])
+            cell = parent
+        codes.reverse()
+        return cls(start_cell, codes)
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __bool__(self) -> bool:
+        return len(self.codes) > 0
+
+    def __iter__(self):
+        return self.Cells()
+
+    def __getitem__(self, index):
+        if not isinstance(index, slice):
+            if index < 0:
+                index += len(self.codes) + 1
+            if not 0 <= index <= len(self.codes):
+                raise IndexError("Path index out of range")
+            return self.CellAt(index)
+        start, stop, step = index.indices(len(self.codes))
+        if step != 1:
+            raise ValueError("Path slices must be contiguous")
+        return Path(self.CellAt(start), self.codes[start:max(start, stop)])
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Path):
+            return NotImplemented
+        return self.start_cell == other.start_cell and self.codes == other.codes
+
+    def __repr__(self) -> str:
+        return f"Path({self.start_cell}, {self.AsString()!r})"
+
+    @property
+    def end_cell(self) -> tuple[int, int]:
+        return self.CellAt(len(self.codes))
+
+    def CellAt(self, index: int) -> tuple[int, int]:
+        """Cell reached after `index` steps"""
+        if index < CHECKPOINT_STRIDE:
+            x, y = self.start_cell
+            offset = 0
+        else:
+            checkpoints = self._Checkpoints()
+            block = min(index // CHECKPOINT_STRIDE, len(checkpoints) - 1)
+            x, y = checkpoints[block]
+            offset = block * CHECKPOINT_STRIDE
+        for code in self.codes[offset:index]:
+            dx, dy = STEPS[code]
+            x, y = x + dx, y + dy
+        return x, y
+
+    def _Checkpoints(self) -> list[tuple[int, int]]:
+        if self._checkpoints is None:
+            checkpoints = []
+            x, y = self.start_cell
+            for index, code in enumerate(self.codes):
+                if index % CHECKPOINT_STRIDE == 0:
+                    checkpoints.append((x, y))
+                dx, dy = STEPS[code]
+                x, y = x + dx, y + dy
+            self._checkpoints = checkpoints
+        return self._checkpoints
+
+    def Cells(self):
+        x, y = self.start_cell
+        yield x, y
+        for code in self.codes:
+            dx, dy = STEPS[code]
+            x, y = x + dx, y + dy
+            yield x, y
+
+    def Directions(self):
+        for code in self.codes:
+            yield DIRECTIONS[code]
+
+    def WithoutDeadEnds(self) -> "Path":
+        """Cancel every step that is immediately walked back (e.g. "EW", "NS")"""
+        codes = bytearray()
+        for code in self.codes:
+            if codes and codes[-1] == code ^ 1:
+                codes.pop()
+            else:
+                codes.append(code)
+        return Path(self.start_cell, codes)
+
+    def AsDict(self) -> dict:
+        """The {cell: next_cell} format (a fresh dict, tracePath consumes it)"""
+        cells = self.Cells()
+        previous = next(cells)
+        path = dict()
+        for cell in cells:
+            path[previous] = cell
+            previous = cell
+        return path
+
+    def AsString(self) -> str:
+        return "".join(self.Directions())
+
+    def AsList(self) -> list[tuple[int, int]]:
+        return list(self.Cells())
+
+
+def Direction(cell, next_cell) -> str:
+    """Compass direction of the step between two adjacent cells"""
+    dx, dy = next_cell[0] - cell[0], next_cell[1] - cell[1]
+    return DIRECTIONS[STEPS.index((dx, dy))]
@@ -0,0 +1,174 @@
+"""
+Race mode - runs every solver on one shared maze and reports setup time,
+solve time, cells explored and path length side by side.
+
+Small mazes are raced in this process, one solver after another: there,
+spawning workers costs more than all four solvers together. Larger mazes
+put their packed walls in shared memory once and give each solver its own
+worker process, so the race takes about as long as the slowest solver.
+Run headless with: python MazeRace.py --rows 300 --cols 300
+"""
+
+import argparse
+import multiprocessing
+import time
+from multiprocessing.shared_memory import SharedMemory
+
+from MazeConnectivity import ConnectivityIndex
+from MazeGeneration import GenerateTiledMaze, TiledMaze
+from MazeSolving import SOLVERS, Solve, UnreachableGoalError, WallFollowingLoopError
+
+# Up to this many cells the solvers run in-process (spawning ~400 ms costs more)
+IN_PROCESS_CELLS = 40_000
+
+
+def _Setup(maze) -> tuple[ConnectivityIndex, float]:
+    """Build the work every solver shares: maze_map and the connectivity index"""
+    started = time.perf_counter()
+    maze.maze_map
+    connectivity = ConnectivityIndex(maze)
+    return connectivity, (time.perf_counter() - started) * 1000
+
+
+def _Race(maze, algorithm: str, start_cell, connectivity, setup_ms: float) -> dict:
+    started = time.perf_counter()
+    try:
+        path, explored = Solve(maze, algorithm, start_cell, connectivity)
+    except (UnreachableGoalError, WallFollowingLoopError) as error:
+        return {"algorithm": algorithm, "error": str(error)}
+    return {
+        "algorithm": algorithm,
+        "setup_ms": setup_ms,
+        "solve_ms": (time.perf_counter() - started) * 1000,
+        "explored": explored,
+        "steps": len(path),
+        "path": path,
+    }
+
+
+# ---------- Worker: executed inside the pool processes ----------
+def _RaceJob(
+    algorithm: str, memory_name: str, rows: int, cols: int, start_cell
+) -> dict:
+    memory = SharedMemory(name=memory_name)
+    try:
+        maze = TiledMaze(rows, cols, bytearray(memory.buf[: rows * cols]))
+    finally:
+        memory.close()
+    connectivity, setup_ms = _Setup(maze)
+    return _Race(maze, algorithm, start_cell, connectivity, setup_ms)
+
+
+def _RaceInProcess(maze, start_cell, algorithms) -> list[dict]:
+    connectivity, setup_ms = _Setup(maze)
+    return [
+        _Race(maze, algorithm, start_cell, connectivity, setup_ms)
+        for algorithm in algorithms
+    ]
+
+
+def _RaceInWorkers(maze, start_cell, algorithms, workers, timeout) -> list[dict]:
+    rows, cols = maze.rows, maze.cols
+    memory = SharedMemory(create=True, size=max(1, rows * cols))
+    # multiprocessing's Pool (not ProcessPoolExecutor) so a solver that runs
+    # past the deadline can be terminated instead of blocking shutdown
+    pool = multiprocessing.get_context("spawn").Pool(workers or len(algorithms))
+    try:
+        memory.buf[: rows * cols] = maze.walls
+        pending = [
+            pool.apply_async(
+                _RaceJob, (algorithm, memory.name, rows, cols, tuple(start_cell))
+            )
+            for algorithm in algorithms
+        ]
+        deadline = time.perf_counter() + timeout
+        results = []
+        for algorithm, result in zip(algorithms, pending):
+            try:
+                results.append(
+                    result.get(max(0.0, deadline - time.perf_counter()))
+                )
+            except multiprocessing.TimeoutError:
+                results.append(
+                    {"algorithm": algorithm, "error": f"timed out after {timeout:g} s"}
+                )
+        return results
+    finally:
+        pool.terminate()
+        pool.join()
+        memory.close()
+        memory.unlink()
+
+
+def RunRace(
+    maze,
+    start_cell=(1, 1),
+    algorithms=None,
+    workers: int | None = None,
+    timeout: float = 60.0,
+    parallel: bool | None = None,
+) -> tuple[list[dict], float]:
+    """
+    Solve the maze with every algorithm (all of SOLVERS by default) and
+    return one result per algorithm, in the order given, plus the total
+    wall time in milliseconds. Accepts a TiledMaze or a pyamaze maze.
+
+    parallel defaults to True above IN_PROCESS_CELLS cells. In parallel
+    runs a solver still going after `timeout` seconds is stopped and
+    reported as an error row, like an unreachable goal.
+    """
+    if algorithms is None:
+        algorithms = list(SOLVERS)
+    if not isinstance(maze, TiledMaze):
+        maze = TiledMaze.FromMazeMap(maze.maze_map, maze.rows, maze.cols)
+    if parallel is None:
+        parallel = maze.rows * maze.cols > IN_PROCESS_CELLS
+
+    started = time.perf_counter()
+    if parallel:
+        results = _RaceInWorkers(maze, start_cell, algorithms, workers, timeout)
+    else:
+        results = _RaceInProcess(maze, start_cell, algorithms)
+    return results, (time.perf_counter() - started) * 1000
+
+
+def FormatReport(results: list[dict], total_ms: float) -> str:
+    lines = [
+        f"{'Algorithm':<15}{'Setup (ms)':>12}{'Solve (ms)':>12}"
+        f"{'Explored':>10}{'Path length':>13}"
+    ]
+    for result in results:
+        if "error" in result:
+            lines.append(f"{result['algorithm']:<15}  {result['error']}")
+            continue
+        lines.append(
+            f"{result['algorithm']:<15}{result['setup_ms']:>12.1f}"
+            f"{result['solve_ms']:>12.1f}{result['explored']:>10}"
+            f"{result['steps'] + 1:>13}"
+        )
+    lines.append(
+        f"Total: {total_ms:.1f} ms. Explored = distinct cells expanded "
+        "(for Wallfollowing, cells stepped on)."
+    )
+    return "\n".join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Race all solvers on one maze")
+    parser.add_argument("--rows", type=int, default=100)
+    parser.add_argument("--cols", type=int, default=100)
+    parser.add_argument("--loopPercent", type=int, default=0)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--start", type=int, nargs=2, default=(1, 1))
+    parser.add_argument("--timeout", type=float, default=60.0)
+    args = parser.parse_args()
+
+    maze = GenerateTiledMaze(
+        args.rows, args.cols, loopPercent=args.loopPercent, seed=args.seed
+    )
+    results, total_ms = RunRace(maze, tuple(args.start), timeout=args.timeout)
+    print(FormatReport(results, total_ms))
+
+
+if __name__ == "__main__":
+    main()
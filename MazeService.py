@@ -0,0 +1,411 @@
+"""
+Local maze service - answers generate and solve requests over HTTP/JSON on
+localhost, so other tools can get results without the Tk GUI or a new Python
+process per request.
+
+    POST /generate  {"rows", "cols", "seed"?, "loopPercent"?}
+    POST /solve     {"algorithm", "rows", "cols", "start_cell"?, "seed"?,
+                     "loopPercent"?, "walls"?}
+    GET  /stats
+
+"walls" is the base64 packed maze returned by /generate; without it /solve
+generates the maze from rows/cols/seed first. A missing seed is picked at
+random, and the seed used is returned so the maze can be made again. CPU-bound work runs in a
+bounded process pool with a per-job time limit (504 past it). Requests
+wait in a bounded queue and are rejected with 503 once it is full.
+Run with: python MazeService.py --port 8765
+"""
+
+import argparse
+import asyncio
+import base64
+import json
+import multiprocessing
+import os
+import random
+import signal
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from MazeGeneration import GenerateTiledMaze, TiledMaze
+from MazeSolving import SOLVERS, Solve, UnreachableGoalError, WallFollowingLoopError
+
+# A 1000x1000 solve takes ~12 s and ~700 MB in a worker, well inside the
+# default job_timeout; 4M cells would always time out and could exhaust RAM
+MAX_CELLS = 1_000_000
+MAX_BODY = 16 * 1024 * 1024
+
+REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    413: "Payload Too Large",
+    422: "Unprocessable Entity",
+    500: "Internal Server Error",
+    503: "Service Unavailable",
+    504: "Gateway Timeout",
+}
+
+
+class BadRequest(Exception):
+    """A request the service refuses; carries the HTTP status to answer with"""
+
+    def __init__(self, message: str, status: int = 400) -> None:
+        super().__init__(message)
+        self.status = status
+
+    def __reduce__(self):
+        # Keep the status when the error crosses back from a pool process
+        return BadRequest, (str(self), self.status)
+
+
+class JobTimeout(Exception):
+    """A job ran past the service's per-job time limit"""
+
+
+# ---------- Jobs: executed inside the pool processes ----------
+def _RaiseTimeout(signum, frame):
+    raise JobTimeout("Job exceeded the time limit")
+
+
+def _RunJob(job, request: dict, timeout: float) -> dict:
+    """Run a job, interrupting it after `timeout` seconds where SIGALRM exists"""
+    limited = hasattr(signal, "setitimer")
+    if limited:
+        signal.signal(signal.SIGALRM, _RaiseTimeout)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        return job(request)
+    finally:
+        if limited:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+
+
+def _BuildMaze(request: dict) -> TiledMaze:
+    rows, cols = request["rows"], request["cols"]
+    if "walls" in request:
+        try:
+            walls = bytearray(base64.b64decode(request["walls"], validate=True))
+        except ValueError:
+            raise BadRequest("walls is not valid base64")
+        if len(walls) != rows * cols:
+            raise BadRequest("walls does not match rows x cols")
+        return TiledMaze(rows, cols, walls)
+    return GenerateTiledMaze(
+        rows,
+        cols,
+        loopPercent=request.get("loopPercent", 0),
+        seed=request["seed"],
+        workers=1,
+    )
+
+
+def _GenerateJob(request: dict) -> dict:
+    maze = _BuildMaze(request)
+    return {
+        "rows": maze.rows,
+        "cols": maze.cols,
+        "seed": request["seed"],
+        "walls": base64.b64encode(maze.walls).decode("ascii"),
+    }
+
+
+def _SolveJob(request: dict) -> dict:
+    maze = _BuildMaze(request)
+    start_cell = tuple(request.get("start_cell", (1, 1)))
+    started = time.perf_counter()
+    try:
+        path, explored = Solve(maze, request["algorithm"], start_cell)
+    except (UnreachableGoalError, WallFollowingLoopError) as error:
+        raise BadRequest(str(error), 422)
+    return {
+        "algorithm": request["algorithm"],
+        "seed": request.get("seed"),  # None when the maze came in as walls
+        "start_cell": list(start_cell),
+        "steps": len(path),
+        "explored": explored,
+        "path": path.AsString(),
+        "solve_ms": (time.perf_counter() - started) * 1000,
+    }
+
+
+def _IsInteger(value) -> bool:
+    # JSON true/false arrive as bool, which is an int subclass
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def _Validate(route: str, request) -> dict:
+    if not isinstance(request, dict):
+        raise BadRequest("Body must be a JSON object")
+    rows, cols = request.get("rows"), request.get("cols")
+    if not (_IsInteger(rows) and _IsInteger(cols)) or rows < 1 or cols < 1:
+        raise BadRequest("rows and cols must be positive integers")
+    if rows * cols > MAX_CELLS:
+        raise BadRequest(f"Mazes are limited to {MAX_CELLS} cells")
+    if route == "/solve":
+        if request.get("algorithm") not in SOLVERS:
+            raise BadRequest(f"algorithm must be one of {list(SOLVERS)}")
+        start_cell = request.setdefault("start_cell", [1, 1])
+        if not (
+            isinstance(start_cell, list)
+            and len(start_cell) == 2
+            and all(_IsInteger(i) for i in start_cell)
+        ):
+            raise BadRequest("start_cell must be [x, y]")
+        x, y = start_cell
+        if not (1 <= x <= rows and 1 <= y <= cols):
+            raise BadRequest("start_cell is outside the maze")
+    if not _IsInteger(request.get("seed", 0)):
+        raise BadRequest("seed must be an integer")
+    if "walls" not in request:
+        request.setdefault("seed", random.randrange(2**32))
+    loop_percent = request.get("loopPercent", 0)
+    if not _IsInteger(loop_percent) or not 0 <= loop_percent <= 100:
+        raise BadRequest("loopPercent must be an integer from 0 to 100")
+    if not isinstance(request.get("walls", ""), str):
+        raise BadRequest("walls must be a base64 string")
+    return request
+
+
+# ---------- Service ----------
+class MazeService:
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 8765,
+        workers: int | None = None,
+        queue_size: int = 64,
+        job_timeout: float = 30.0,
+    ) -> None:
+        self.host = host
+        self.port = port
+        self.workers = workers or os.cpu_count() or 1
+        self.queue_size = queue_size
+        self.job_timeout = job_timeout
+        self.routes = {"/generate": _GenerateJob, "/solve": _SolveJob}
+
+        self.received = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self.latencies = deque(maxlen=1000)  # milliseconds, most recent requests
+
+    async def Start(self) -> int:
+        """Start serving and return the bound port (useful with port=0)"""
+        # spawn (as the GUI uses) so workers never inherit client sockets
+        self.pool = ProcessPoolExecutor(
+            max_workers=self.workers, mp_context=multiprocessing.get_context("spawn")
+        )
+        self.queue = asyncio.Queue(maxsize=self.queue_size)
+        # One dispatcher per pool worker keeps at most `workers` jobs in flight
+        self.dispatchers = [
+            asyncio.create_task(self._Dispatch()) for _ in range(self.workers)
+        ]
+        self.server = await asyncio.start_server(
+            self._HandleConnection, self.host, self.port
+        )
+        self.port = self.server.sockets[0].getsockname()[1]
+        return self.port
+
+    async def Stop(self) -> None:
+        self.server.close()
+        await self.server.wait_closed()
+        for dispatcher in self.dispatchers:
+            dispatcher.cancel()
+        self.pool.shutdown(wait=False, cancel_futures=True)
+
+    async def ServeForever(self) -> None:
+        await self.Start()
+        print(f"Maze service listening on http://{self.host}:{self.port}")
+        try:
+            await self.server.serve_forever()
+        finally:
+            await self.Stop()
+
+    def Stats(self) -> dict:
+        latencies = sorted(self.latencies)
+
+        def percentile(p: float) -> float | None:
+            if not latencies:
+                return None
+            return latencies[min(len(latencies) - 1, int(len(latencies) * p))]
+
+        return {
+            "workers": self.workers,
+            "queue_size": self.queue_size,
+            "queue_depth": self.queue.qsize(),
+            "received": self.received,
+            "completed": self.completed,
+            "failed": self.failed,
+            "rejected": self.rejected,
+            "latency_ms": {
+                "p50": percentile(0.5),
+                "p95": percentile(0.95),
+                "max": latencies[-1] if latencies else None,
+            },
+        }
+
+    async def _Dispatch(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            job, request, future = await self.queue.get()
+            try:
+                if not future.cancelled():
+                    # The worker stops itself at job_timeout; this outer limit
+                    # only matters where SIGALRM is missing (Windows)
+                    result = await asyncio.wait_for(
+                        loop.run_in_executor(
+                            self.pool, _RunJob, job, request, self.job_timeout
+                        ),
+                        self.job_timeout + 5,
+                    )
+                    future.set_result(result)
+            except asyncio.TimeoutError:
+                if not future.cancelled():
+                    future.set_exception(JobTimeout("Job exceeded the time limit"))
+            except Exception as error:
+                if not future.cancelled():
+                    future.set_exception(error)
+            finally:
+                self.queue.task_done()
+
+    async def _Submit(self, route: str, request: dict) -> tuple[int, dict]:
+        received = time.perf_counter()
+        future = asyncio.get_running_loop().create_future()
+        try:
+            self.queue.put_nowait((self.routes[route], request, future))
+        except asyncio.QueueFull:
+            self.rejected += 1
+            return 503, {
+                "error": "Queue is full, retry later",
+                "queue_depth": self.queue.qsize(),
+            }
+        queue_depth = self.queue.qsize()
+
+        try:
+            result = await future
+        except BadRequest as error:
+            self.failed += 1
+            return error.status, {"error": str(error)}
+        except JobTimeout as error:
+            self.failed += 1
+            return 504, {"error": f"{error} ({self.job_timeout} s)"}
+        except Exception as error:
+            self.failed += 1
+            return 500, {"error": f"{type(error).__name__}: {error}"}
+
+        finished = time.perf_counter()
+        self.completed += 1
+        self.latencies.append((finished - received) * 1000)
+        result["latency_ms"] = (finished - received) * 1000
+        result["queue_depth"] = queue_depth
+        return 200, result
+
+    async def _HandleConnection(self, reader, writer) -> None:
+        try:
+            try:
+                status, body = await self._HandleRequest(reader)
+            except BadRequest as error:
+                status, body = error.status, {"error": str(error)}
+            except (asyncio.IncompleteReadError, asyncio.TimeoutError, ConnectionError):
+                return
+            except Exception as error:
+                # Never leave a client without an answer
+                status, body = 500, {"error": f"{type(error).__name__}: {error}"}
+
+            data = json.dumps(body).encode()
+            headers = [
+                f"HTTP/1.1 {status} {REASONS[status]}",
+                "Content-Type: application/json",
+                f"Content-Length: {len(data)}",
+                "Connection: close",
+            ]
+            if status == 503:
+                headers.append("Retry-After: 1")
+            writer.write(("\r\n".join(headers) + "\r\n\r\n").encode() + data)
+            try:
+                await writer.drain()
+            except ConnectionError:
+                pass
+        finally:
+            writer.close()
+
+    async def _HandleRequest(self, reader) -> tuple[int, dict]:
+        request_line = await asyncio.wait_for(reader.readline(), timeout=10)
+        try:
+            method, target, _ = request_line.decode("latin-1").split()
+        except ValueError:
+            raise BadRequest("Malformed request line")
+
+        length = 0
+        while True:
+            line = await asyncio.wait_for(reader.readline(), timeout=10)
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            if name.strip().lower() == "content-length":
+                value = value.strip()
+                if not (value.isascii() and value.isdigit()):
+                    raise BadRequest("Invalid Content-Length")
+                length = int(value)
+        if length > MAX_BODY:
+            raise BadRequest("Request body too large", 413)
+        body = await asyncio.wait_for(reader.readexactly(length), timeout=10)
+
+        if method == "GET" and target == "/stats":
+            return 200, self.Stats()
+        if method != "POST" or target not in self.routes:
+            raise BadRequest(f"No route for {method} {target}", 404)
+        self.received += 1
+        try:
+            request = json.loads(body or b"{}")
+        except (ValueError, RecursionError):
+            # ValueError covers bad JSON and bad UTF-8; RecursionError deep nesting
+            raise BadRequest("Body is not valid JSON")
+        return await self._Submit(target, _Validate(target, request))
+
+
+# ---------- Client helper ----------
+async def Request(
+    host: str, port: int, method: str, target: str, payload: dict | None = None
+) -> tuple[int, dict]:
+    """Send one request to a running MazeService and return (status, body)"""
+    reader, writer = await asyncio.open_connection(host, port)
+    data = json.dumps(payload).encode() if payload is not None else b""
+    writer.write(
+        (
+            f"{method} {target} HTTP/1.1\r\nHost: {host}\r\n"
+            f"Content-Type: application/json\r\nContent-Length: {len(data)}\r\n"
+            "Connection: close\r\n\r\n"
+        ).encode()
+        + data
+    )
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    head, _, body = response.partition(b"\r\n\r\n")
+    status = int(head.split(b" ", 2)[1])
+    return status, json.loads(body)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Local maze generate/solve service")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--queue-size", type=int, default=64)
+    parser.add_argument("--job-timeout", type=float, default=30.0)
+    args = parser.parse_args()
+
+    service = MazeService(
+        args.host, args.port, args.workers, args.queue_size, args.job_timeout
+    )
+    try:
+        asyncio.run(service.ServeForever())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,34 @@
 from queue import Queue, PriorityQueue
+from MazeConnectivity import ConnectivityIndex, IsOpen, UnreachableGoalError
+from MazePath import Path, CODES
+
+
+class WallFollowingLoopError(ValueError):
+    """Raised when the wall follower walks in a circle and never meets the goal"""
+
+
+def EnsureReachable(maze, start_cell, goal_cell, connectivity=None) -> None:
+    """
+    Fail fast instead of exhausting the start cell's component. Without a
+    shared connectivity index a fresh one is built from the current map.
+    """
+    if connectivity is None:
+        connectivity = ConnectivityIndex(maze)
+    if not connectivity.IsReachable(start_cell, goal_cell):
+        raise UnreachableGoalError(
+            f"Goal {goal_cell} cannot be reached from {start_cell}"
+        )
 
 
 class A_Star:
 
-    def __init__(self, maze, start_cell=(1, 1)) -> None:
+    def __init__(self, maze, start_cell=(1, 1), connectivity=None) -> None:
         self.maze = maze
         self.start_cell = start_cell
         self.goal_cell = (self.maze.rows, self.maze.cols)
+        self.connectivity = connectivity
         self.open_cells = PriorityQueue()
+        self.explored = 0  # distinct cells expanded
         self.g_cost = {cell: float("inf") for cell in maze.grid}
         self.g_cost[self.start_cell] = 0
         self.f_cost = {cell: float("inf") for cell in maze.grid}
@@ -21,6 +42,7 @@ class A_Star:
         return abs(current_x - target_x) + abs(current_y - target_y)
 
     def pathFinding(self):
+        EnsureReachable(self.maze, self.start_cell, self.goal_cell, self.connectivity)
         path = dict()
         child_cell = ()
         self.open_cells.put(
@@ -31,11 +53,14 @@ class A_Star:
             )
         )
         while not self.open_cells.empty():
-            current_cell = self.open_cells.get()[2]  # gets the current cell
+            f_cost, _, current_cell = self.open_cells.get()  # gets the current cell
+            if f_cost > self.f_cost[current_cell]:
+                continue  # stale entry, the cell was queued again more cheaply
+            self.explored += 1
             if current_cell == self.goal_cell:
                 break
             for direction in "NSEW":  # exploring each direction of current cell
-                if self.maze.maze_map[current_cell][direction] == 1:
+                if IsOpen(self.maze.maze_map, current_cell, direction):
                     x, y = current_cell
                     if direction == "N":
                         child_cell = (x - 1, y)
@@ -63,34 +88,33 @@ class A_Star:
                         )
                         path[child_cell] = current_cell
 
-        reversed_path = dict()
-        cell = self.goal_cell
-        while cell != self.start_cell:
-            reversed_path[path[cell]] = cell
-            cell = path[cell]
-        return reversed_path
+        return Path.FromParents(path, self.start_cell, self.goal_cell)
 
 
 class BreadthFirstSearch:
-    def __init__(self, maze, start_cell=(1, 1)) -> None:
+    def __init__(self, maze, start_cell=(1, 1), connectivity=None) -> None:
         self.maze = maze
         self.start_cell = start_cell
         self.goal_cell = (self.maze.rows, self.maze.cols)
+        self.connectivity = connectivity
         self.open_cells = Queue()
-        self.visited_cells = []
+        self.visited_cells = set()
+        self.explored = 0  # distinct cells expanded
 
     def pathFinding(self):
+        EnsureReachable(self.maze, self.start_cell, self.goal_cell, self.connectivity)
         self.open_cells.put(self.start_cell)
-        self.visited_cells.append(self.visited_cells)
+        self.visited_cells.add(self.start_cell)
         path = dict()
         search_path = []
         child_cell = ()
         while not self.open_cells.empty():
             current_cell = self.open_cells.get()
+            self.explored += 1
             if current_cell == self.goal_cell:
                 break
             for direction in "ESNW":
-                if self.maze.maze_map[current_cell][direction]:
+                if IsOpen(self.maze.maze_map, current_cell, direction):
                     x, y = current_cell
                     if direction == "E":
                         child_cell = (x, y + 1)
@@ -103,39 +127,38 @@ class BreadthFirstSearch:
                     if child_cell in self.visited_cells:
                         continue
                     self.open_cells.put(child_cell)
-                    self.visited_cells.append(child_cell)
+                    self.visited_cells.add(child_cell)
                     path[child_cell] = current_cell
                     search_path.append(child_cell)
 
-        reversed_path = dict()
-        cell = self.goal_cell
-        while cell != self.start_cell:
-            reversed_path[path[cell]] = cell
-            cell = path[cell]
-        return search_path, reversed_path
+        return search_path, Path.FromParents(path, self.start_cell, self.goal_cell)
 
 
 class DepthFirstSearch:
-    def __init__(self, maze, start_cell=(1, 1)) -> None:
+    def __init__(self, maze, start_cell=(1, 1), connectivity=None) -> None:
         self.maze = maze
         self.start_cell = start_cell
         self.goal_cell = (self.maze.rows, self.maze.cols)
+        self.connectivity = connectivity
         self.open_cells = []  # Stack Implementation
-        self.visited_cells = []
+        self.visited_cells = set()
+        self.explored = 0  # distinct cells expanded
 
     def pathFinding(self):
+        EnsureReachable(self.maze, self.start_cell, self.goal_cell, self.connectivity)
         self.open_cells.append(self.start_cell)
-        self.visited_cells.append(self.visited_cells)
+        self.visited_cells.add(self.start_cell)
         path = dict()
         search_path = []
         child_cell = ()
         while len(self.open_cells) > 0:
             current_cell = self.open_cells.pop()
+            self.explored += 1
             search_path.append(current_cell)
             if current_cell == self.goal_cell:
                 break
             for direction in "ESNW":
-                if self.maze.maze_map[current_cell][direction]:
+                if IsOpen(self.maze.maze_map, current_cell, direction):
                     x, y = current_cell
                     if direction == "E":
                         child_cell = (x, y + 1)
@@ -148,23 +171,20 @@ class DepthFirstSearch:
                     if child_cell in self.visited_cells:
                         continue
                     self.open_cells.append(child_cell)
-                    self.visited_cells.append(child_cell)
+                    self.visited_cells.add(child_cell)
                     path[child_cell] = current_cell
 
-        reversed_path = dict()
-        cell = self.goal_cell
-        while cell != self.start_cell:
-            reversed_path[path[cell]] = cell
-            cell = path[cell]
-        return search_path, reversed_path
+        return search_path, Path.FromParents(path, self.start_cell, self.goal_cell)
 
 
 class WallFollowing:
-    def __init__(self, maze, start_cell=(1, 1)) -> None:
+    def __init__(self, maze, start_cell=(1, 1), connectivity=None) -> None:
         self.maze = maze
         self.start_cell = start_cell
         self.goal_cell = (self.maze.rows, self.maze.cols)
+        self.connectivity = connectivity
         self.directions = {"forward": "N", "left": "W", "back": "S", "right": "E"}
+        self.explored = 0  # distinct cells expanded (stepped on)
 
     def RotateClockWise(self):
         keys = list(self.directions.keys())
@@ -194,27 +214,61 @@ class WallFollowing:
             return (x + 1, y), "S"
 
     def pathFinding(self):
-        path = ""
+        EnsureReachable(self.maze, self.start_cell, self.goal_cell, self.connectivity)
+        path = bytearray()  # one direction code per step
         current_cell = self.start_cell
+        # The heading fixes the whole rotation, so a repeated (cell, heading)
+        # means the walk has closed a loop (e.g. around an island of walls)
+        seen_states = set()
         while True:
             if current_cell == self.goal_cell:
                 break
-            if self.maze.maze_map[current_cell][self.directions["left"]] == 0:
-                if self.maze.maze_map[current_cell][self.directions["forward"]] == 0:
+            state = (current_cell, self.directions["forward"])
+            if state in seen_states:
+                raise WallFollowingLoopError(
+                    f"Wall following from {self.start_cell} loops without "
+                    f"reaching {self.goal_cell}"
+                )
+            seen_states.add(state)
+            if not IsOpen(self.maze.maze_map, current_cell, self.directions["left"]):
+                if not IsOpen(
+                    self.maze.maze_map, current_cell, self.directions["forward"]
+                ):
                     self.RotateClockWise()
                 else:
                     current_cell, d = self.MoveForward(current_cell)  # type:ignore
-                    path += d
+                    path.append(CODES[d])
             else:
                 self.RotateAntiClockWise()
                 current_cell, d = self.MoveForward(current_cell)  # type:ignore
-                path += d
-
-        # path2 is the path where it doesn't explore any dead end
-        path2 = path
-        while "EW" in path2 or "WE" in path2 or "NS" in path2 or "SN" in path2:
-            path2 = path2.replace("EW", "")
-            path2 = path2.replace("WE", "")
-            path2 = path2.replace("NS", "")
-            path2 = path2.replace("SN", "")
-        return path2, path
+                path.append(CODES[d])
+
+        deadends_path = Path(self.start_cell, path)
+        self.explored = len(set(deadends_path.Cells()))
+        # The path without any of the dead ends explored along the way
+        return deadends_path.WithoutDeadEnds(), deadends_path
+
+
+# Solvers by the names the GUI shows
+SOLVERS = {
+    "A*": A_Star,
+    "BFS": BreadthFirstSearch,
+    "DFS": DepthFirstSearch,
+    "Wallfollowing": WallFollowing,
+}
+
+
+def Solve(
+    maze, algorithm: str, start_cell=(1, 1), connectivity=None
+) -> tuple[Path, int]:
+    """
+    Run a solver by name; returns its solution path and how many distinct
+    cells it expanded (for the wall follower, the cells it stepped on)
+    """
+    solver = SOLVERS[algorithm](maze, start_cell, connectivity)
+    result = solver.pathFinding()
+    if isinstance(result, Path):
+        return result, solver.explored
+    if algorithm == "Wallfollowing":
+        return result[0], solver.explored  # the path without dead ends
+    return result[1], solver.explored  # BFS / DFS also return their search order